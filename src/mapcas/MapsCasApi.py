@@ -1,4 +1,7 @@
+import time
+
 from MapsGenericApi import *
+from MapsGenericApi import _EMPTY_GCLIST
 
 
 class CasClient(MapsClient):
@@ -12,12 +15,14 @@ class CasClient(MapsClient):
     :param server_port: TCP Port of remote MAPS server, typically 10024.
     :param testbed: .xml testbed profile for server to use on init.
     """
+    __slots__ = ("active_lines", "_call_to_line")
 
     def __init__(self, server_ip, server_port, testbed="TestBedDefault.xml"):
         """Create a CasClient Object to communicate with remote server"""
         super(CasClient, self).__init__(server_ip, server_port, testbed)
         self.protocol = 'CAS'
         self.active_lines = {}
+        self._call_to_line = {}
 
     def load_profile_group(self, profile_group="CAS_Profiles.xml"):
         """Loads a new .xml profile group into MAPS server testbed
@@ -36,28 +41,63 @@ class CasClient(MapsClient):
         :type line: int
         :returns: CasCall object
         """
+        handle = self._start_line(line)
+        if handle != 0:
+            result = self._await_lines_ready([handle])[0]
+            if result == SUCCESS:
+                return self._register_line(line, handle)
+            return CasCall(result, None, None, None)
+
+    def _start_line(self, line):
+        """Send the request to start the CAS script for the analog line
+
+        :param line: analog line number
+        :type line: int
+        :returns: script handle, 0 if the request failed
+        """
         cardno = self.get_card_from_line(line)
         ts = self.get_timeslot_from_line(line)
 
         script_name = "CLI_CAS.gls"
         profile = "Card1TS00"
-        gc1 = "Cardno", "(i)" + str(cardno)
-        gc2 = "TS", "(i)" + str(ts)
+        gc1 = "Cardno", "(i)%s" % cardno
+        gc2 = "TS", "(i)%s" % ts
         gc_list = [gc1, gc2]
+        return maps.StartScript(self.connection_id, script_name, profile, 1, gc_list)
 
-        handle = maps.StartScript(self.connection_id, script_name, profile, 1, gc_list)
-        if handle != 0:
-            status = maps.WaitForEvent(handle, "ScriptStatus", DEFAULT_TIME_OUT)
-            if status == "Running":
-                status = maps.WaitForEvent(handle, "TSStatus", DEFAULT_TIME_OUT)
-                if status == "TS is unique":
-                    tmp_call = CasCall(handle, maps, "LOW", "CAS")
-                    self.active_lines[line] = tmp_call
-                    return tmp_call
-                else:
-                    return CasCall(SERVER_ERROR_SCRIPT_IS_ALREADY_STARTED_ON_THE_SAME_SCRIPTID, None, None, None)
+    def _await_lines_ready(self, handles):
+        """Wait for started line scripts to run and reserve their timeslot
+
+        All scripts are expected to be starting at the same time, so each status
+        is collected for the whole batch before moving on to the next one.
+
+        :param handles: script handles returned by _start_line()
+        :returns: list of 0 for success, error code otherwise, one per handle
+        """
+        results = [CREATE_HANDLE_FAILURE] * len(handles)
+        statuses = self._batch_wait_for_event(handles, "ScriptStatus", DEFAULT_TIME_OUT)
+        running = [idx for idx, status in enumerate(statuses) if status == "Running"]
+
+        statuses = self._batch_wait_for_event([handles[idx] for idx in running], "TSStatus", DEFAULT_TIME_OUT)
+        for idx, status in zip(running, statuses):
+            if status == "TS is unique":
+                results[idx] = SUCCESS
             else:
-                return CasCall(CREATE_HANDLE_FAILURE, None, None, None)
+                results[idx] = SERVER_ERROR_SCRIPT_IS_ALREADY_STARTED_ON_THE_SAME_SCRIPTID
+        return results
+
+    def _register_line(self, line, handle):
+        """Create the CasCall object for a reserved line and mark the line active
+
+        :param line: analog line number
+        :param handle: script handle of the running line script
+        :returns: CasCall object
+        """
+        tmp_call = CasCall(handle, maps, "LOW", "CAS")
+        tmp_call.line = line
+        self.active_lines[line] = tmp_call
+        self._call_to_line[handle] = line
+        return tmp_call
 
     def close_line(self, call):
         """Close and release the line
@@ -65,23 +105,47 @@ class CasClient(MapsClient):
         :param call: CasCall object
         :returns: 0 for success, error code otherwise
         """
-        result = SUCCESS
+        result = self._close_lines([call])[0]
+        self.response_code = result
+        return result
+
+    def _close_lines(self, calls):
+        """Close and release several lines at once
+
+        :param calls: list of CasCall objects
+        :returns: list of 0 for success, error code otherwise, one per call
+        """
+        for call in calls:
+            line = self._call_to_line.pop(call.handle, None)
+            if line is not None:
+                del self.active_lines[line]
+        return self._stop_scripts([call.handle for call in calls])
+
+    def _stop_scripts(self, handles):
+        """Stop several line scripts at once
 
-        for k, v in self.active_lines.items():
-            if v == call:
-                del self.active_lines[k]
+        Every StopScript request is sent before any status is collected, so the
+        server stops the scripts concurrently.
+
+        :param handles: script handles returned by _start_line()
+        :returns: list of 0 for success, error code otherwise, one per handle
+        """
+        results = [SUCCESS] * len(handles)
+        stopping = []
+        for idx, handle in enumerate(handles):
+            if maps.StopScript(handle) != 0:
+                stopping.append(idx)
+            else:
+                results[idx] = SENDING_FAILED
 
-        if maps.StopScript(call.handle) != 0:
-            status = maps.WaitForEvent(call.handle, "StopScriptStatus", DEFAULT_TIME_OUT)
+        statuses = self._batch_wait_for_event([handles[idx] for idx in stopping], "StopScriptStatus",
+                                              DEFAULT_TIME_OUT)
+        for idx, status in zip(stopping, statuses):
             if status == "":
-                result = SERVER_ERROR_TEST_BED_NOT_STARTED
+                results[idx] = SERVER_ERROR_TEST_BED_NOT_STARTED
             elif status != "Script Stopped":
-                result = SERVER_ERROR_SCRIPT_NOT_AVAILABLE
-        else:
-            result = SENDING_FAILED
-
-        self.response_code = result
-        return result
+                results[idx] = SERVER_ERROR_SCRIPT_NOT_AVAILABLE
+        return results
 
     def get_cas_call(self, line):
         """Return the CasCall object based on the line number. CasCall
@@ -104,7 +168,7 @@ class CasClient(MapsClient):
         :type line: int
         :return: T1 card number
         """
-        return (line - 1) / 24 + 1
+        return (line - 1) // 24 + 1
 
     @staticmethod
     def get_timeslot_from_line(line):
@@ -115,6 +179,37 @@ class CasClient(MapsClient):
         """
         return (line - 1) % 24
 
+    @staticmethod
+    def _batch_user_event(handles, event_name, var_list):
+        """Send the same user event to several scripts back to back
+
+        :param handles: script IDs to send the event to
+        :param event_name: user event name
+        :param var_list: variables to pass to CLI server
+        :returns: list of booleans, True where the event was sent
+        """
+        return [maps.UserEvent(handle, event_name, var_list) != 0 for handle in handles]
+
+    @staticmethod
+    def _batch_wait_for_event(handles, event_name, timeout):
+        """Collect the same event from several scripts within one timeout period
+
+        The scripts run concurrently on the server, so the whole batch shares a
+        single deadline instead of waiting up to timeout msec per script.
+
+        :param handles: script IDs to wait on
+        :param event_name: event name to wait for
+        :param timeout: timeout in msec for the whole batch
+        :type timeout: int
+        :returns: list of event results, in the same order as handles
+        """
+        deadline = time.time() + timeout / 1000.0
+        results = []
+        for handle in handles:
+            remaining = max(int((deadline - time.time()) * 1000), 1)
+            results.append(maps.WaitForEvent(handle, event_name, remaining))
+        return results
+
     def system_check(self, t1_port):
         """
         Verify T1 system health. Check for dial tone on each timeslot of the specified T1 port
@@ -124,51 +219,41 @@ class CasClient(MapsClient):
         :return: list ranging from 0-23 with the status of each T1 timeslot. Possible statuses are:
             "Port available", "Port in use", "No dial tone", "Hardware error"
         """
-        t1_status = {}
-        calls = {}
-        for i in range(0, 23):
-            t1_status[i] = "Port in use"
+        t1_status = ["Port in use"] * 24
+        calls = [None] * 24
 
         start_port = (t1_port - 1) * 24 + 1
-        end_port = start_port + 24
-
-        # open 24 lines and start dial tone detection
-        curr_port = start_port
-        i = 0
-        while curr_port < end_port:
-            tmp_call = self.open_line(curr_port)
-            if tmp_call.handle != 0:
+
+        # start the script on all 24 lines, then collect their startup results together
+        handles = [self._start_line(start_port + i) for i in range(24)]
+        started = [i for i, handle in enumerate(handles) if handle != 0]
+        results = self._await_lines_ready([handles[i] for i in started])
+        failed = []
+        for i, result in zip(started, results):
+            if result == SUCCESS:
                 t1_status[i] = "Port available"
-                calls[i] = tmp_call
-            curr_port += 1
-            i += 1
-
-        # start detect dial tone
-        curr_port = start_port
-        i = 0
-        gclist = list()
-        while curr_port < end_port:
-            if t1_status[i] == "Port available":
-                tmp_call = self.get_cas_call(curr_port)
-                maps.UserEvent(tmp_call.handle, "Verify Dial Tone", gclist)
-            curr_port += 1
-            i += 1
-
-        # wait for result
-        curr_port = start_port
-        i = 0
-        while curr_port < end_port:
-            if t1_status[i] == "Port available":
-                tmp_call = self.get_cas_call(curr_port)
-                result = maps.WaitForEvent(tmp_call.handle, "VerifyDialTone", 10000)
-                if result == "1":
-                    t1_status[i] = "No dial tone"
-                elif result == "2":
-                    t1_status[i] = "Hardware error"
-                self.close_line(tmp_call)
-            curr_port += 1
-            i += 1
-        time.sleep(1)
+                calls[i] = self._register_line(start_port + i, handles[i])
+            else:
+                failed.append(handles[i])
+
+        # start detect dial tone on every available port, then collect results
+        ports = [i for i, call in enumerate(calls) if call is not None]
+        sent = self._batch_user_event([calls[i].handle for i in ports], "Verify Dial Tone", _EMPTY_GCLIST)
+        checked = []
+        for i, ok in zip(ports, sent):
+            if ok:
+                checked.append(i)
+            else:
+                t1_status[i] = "Hardware error"
+        results = self._batch_wait_for_event([calls[i].handle for i in checked], "VerifyDialTone", 10000)
+        for i, result in zip(checked, results):
+            if result == "1":
+                t1_status[i] = "No dial tone"
+            elif result == "2":
+                t1_status[i] = "Hardware error"
+        self._close_lines([calls[i] for i in ports])
+        # scripts that started but did not reserve their timeslot are stopped too
+        self._stop_scripts(failed)
         return t1_status
 
 
@@ -189,13 +274,43 @@ class CasCall(MapsCall):
     :param level: [ HIGH | LOW ], indicates API level.
     :param call_type: [ PLACE_CALL | RECEIVE_CALL | BIND INCOMING CALL ].
     """
-    return_code = ""
-    rx_digits = ""
-    vmwi_status = ""
+    __slots__ = ("return_code", "rx_digits", "vmwi_status", "line")
+
     timeout_fax_default = 100000
 
+    # Variables sent with each detector user event, as (name, type prefix)
+    # pairs. Values are passed to _detect() in the same order.
+    _EVENTS = {
+        "Detect Busy Tone": [("TIMEOUT", "(i)"), ("BUSY_TONE_DURATION", "(i)")],
+        "Detect Call Waiting Tone": [("TIMEOUT", "(i)")],
+        "Detect Caller ID": [("TIMEOUT", "(i)")],
+        "Detect Confirmation Tone": [("TIMEOUT", "(i)")],
+        "Detect Dial Tone": [("TIMEOUT", "(i)"), ("DIAL_TONE_DURATION", "(i)")],
+        "Detect Distinctive Ringing Signal": [("TIMEOUT", "(i)"), ("RING_COUNT", "(i)"),
+                                              ("RON1", "(f)"), ("ROFF1", "(f)"), ("RON2", "(f)"), ("ROFF2", "(f)"),
+                                              ("RON3", "(f)"), ("ROFF3", "(f)"), ("RON4", "(f)"), ("ROFF4", "(f)")],
+        "Detect Howler Tone": [("TIMEOUT", "(i)")],
+        "Detect Reorder Tone": [("TIMEOUT", "(i)"), ("REORDER_TONE_DURATION", "(i)")],
+        "Detect Ring Splash": [("TIMEOUT", "(i)"), ("RING_SPLASH_DURATION", "(f)")],
+        "Detect Ringback Tone": [("TIMEOUT", "(i)")],
+        "Detect Ringing Signal": [("TIMEOUT", "(i)"), ("RING_COUNT", "(i)"), ("RING_ON", "(f)"), ("RING_OFF", "(f)")],
+        "Detect Silence": [("TIMEOUT", "(i)"), ("SILENCE_DURATION", "(i)")],
+        "Detect Special Dial Tone": [("TIMEOUT", "(i)")],
+        "Detect Test Tone": [("TIMEOUT", "(i)")],
+        "Detect Tone": [("TIMEOUT", "(i)"), ("FREQ1", "(i)"), ("FREQ2", "(i)")],
+        "Detect VMWI": [("TIMEOUT", "(i)")],
+        "Verify Speech": [("TIMEOUT", "(i)"), ("SPEECH_DURATION", "(i)")],
+    }
+    # WaitForEvent variable that carries each user event's result: the event
+    # name without spaces. Other event names are added on first use.
+    _RETURN_VAR = dict((name, name.replace(" ", "")) for name in _EVENTS)
+
     def __init__(self, handle, status, level, call_type):
         super(CasCall, self).__init__(handle, status, level, call_type)
+        self.return_code = ""
+        self.rx_digits = ""
+        self.vmwi_status = ""
+        self.line = None
 
     def answer_call(self):
         """Offhook to answer call.
@@ -213,14 +328,51 @@ class CasCall(MapsCall):
         :type timeout: int
         :returns: boolean
         """
-        return_variable = event_name.replace(" ", "")
+        return_variable = self._return_variable(event_name)
         if maps.UserEvent(self.handle, event_name, var_list) != 0:
             self.return_code = maps.WaitForEvent(self.handle, return_variable, timeout + 5000)
-            if self.return_code == "0":
-                return True
+            return self.return_code == "0"
         else:
             return False
 
+    @classmethod
+    def _return_variable(cls, event_name):
+        """Name of the variable the CLI server uses to return the user event result
+
+        :param event_name: user event name
+        :returns: event name without spaces
+        """
+        return_variable = cls._RETURN_VAR.get(event_name)
+        if return_variable is None:
+            return_variable = cls._RETURN_VAR[event_name] = event_name.replace(" ", "")
+        return return_variable
+
+    @classmethod
+    def _build_gclist(cls, event_name, values):
+        """Helper function to build the variable list of a user event described in _EVENTS
+
+        :param event_name: user event name, must be a key of _EVENTS
+        :param values: variable values, in the order listed in _EVENTS
+        :type values: tuple
+        :returns: list of (name, typed value) tuples
+        """
+        return [(name, "%s%s" % (prefix, value)) for (name, prefix), value in zip(cls._EVENTS[event_name], values)]
+
+    def _detect(self, event_name, values, timeout, blocking=True):
+        """Helper function to start a detector user event described in _EVENTS
+
+        :param event_name: user event name, must be a key of _EVENTS
+        :param values: variable values, in the order listed in _EVENTS
+        :param timeout: timeout in msec
+        :type timeout: int
+        :param blocking: wait for the detector result if True, return after sending otherwise
+        :returns: boolean
+        """
+        gclist = self._build_gclist(event_name, values)
+        if blocking:
+            return self.cas_event(event_name, gclist, timeout)
+        return self.cas_user_event_start(event_name, gclist)
+
     def offhook(self):
         """
         Offhook the line
@@ -228,8 +380,7 @@ class CasCall(MapsCall):
         :returns: boolean
         """
         user_event = "Offhook"
-        gclist = list()
-        return self.cas_event(user_event, gclist, timeout_default)
+        return self.cas_event(user_event, _EMPTY_GCLIST, timeout_default)
 
     def onhook(self):
         """
@@ -238,8 +389,7 @@ class CasCall(MapsCall):
         :returns: boolean
         """
         user_event = "Onhook"
-        gclist = list()
-        return self.cas_event(user_event, gclist, timeout_default)
+        return self.cas_event(user_event, _EMPTY_GCLIST, timeout_default)
 
     def place_call(self, num_to_dial="3015551234"):
         """
@@ -275,13 +425,34 @@ class CasCall(MapsCall):
         :type timeout: int
         :returns: boolean
         """
-        return_variable = event_name.replace(" ", "")
+        return_variable = self._return_variable(event_name)
         self.return_code = maps.WaitForEvent(self.handle, return_variable, timeout + 1000)
         if self.return_code == "0":
             return True
         else:
             return False
 
+    def _wait_for_variables(self, variable_names, timeout):
+        """Helper function to collect the result variables a user event returns besides its return code
+
+        PythonMapsCliIfc has no call to fetch several variables at once, so they are
+        read one after the other, in the order given. All of them share one deadline,
+        so a missing variable cannot stretch the wait beyond timeout msec.
+
+        :param variable_names: names of the variables set by the CLI server
+        :param timeout: timeout in msec for all variables together
+        :type timeout: int
+        :returns: list of variable values, in the same order as variable_names
+        """
+        wait_for_event = maps.WaitForEvent
+        handle = self.handle
+        deadline = time.time() + timeout / 1000.0
+        values = []
+        for name in variable_names:
+            remaining = max(int((deadline - time.time()) * 1000), 1)
+            values.append(wait_for_event(handle, name, remaining))
+        return values
+
     def detect_busy_tone(self, timeout=20000, busy_tone_duration=10000):
         """Attempt to detect the busy tone on the line within the specified timeout period. Blocking function.
 
@@ -294,11 +465,7 @@ class CasCall(MapsCall):
         :type busy_tone_duration: int
         :returns: boolean
         """
-        user_event = "Detect Busy Tone"
-        gc1 = 'TIMEOUT', "(i)" + str(timeout)
-        gc2 = 'BUSY_TONE_DURATION', "(i)" + str(busy_tone_duration)
-        gclist = [gc1, gc2]
-        return self.cas_event(user_event, gclist, timeout)
+        return self._detect("Detect Busy Tone", (timeout, busy_tone_duration), timeout)
 
     def detect_busy_tone_start(self, timeout=20000, busy_tone_duration=10000):
         """Start the busy tone detector on the line for the specified timeout period. Non-blocking function.
@@ -312,11 +479,7 @@ class CasCall(MapsCall):
         :type busy_tone_duration: int
         :returns: boolean
         """
-        user_event = "Detect Busy Tone"
-        gc1 = 'TIMEOUT', "(i)" + str(timeout)
-        gc2 = 'BUSY_TONE_DURATION', "(i)" + str(busy_tone_duration)
-        gclist = [gc1, gc2]
-        return self.cas_user_event_start(user_event, gclist)
+        return self._detect("Detect Busy Tone", (timeout, busy_tone_duration), timeout, blocking=False)
 
     def detect_busy_tone_wait_for_result(self, timeout=20000):
         """Wait for busy tone result on the line within the specified timeout period. Blocking function.
@@ -325,8 +488,7 @@ class CasCall(MapsCall):
         :type timeout: int
         :returns: boolean
         """
-        user_event = "Detect Busy Tone"
-        return self.cas_wait_for_event(user_event, timeout)
+        return self.cas_wait_for_event("Detect Busy Tone", timeout)
 
     def detect_call_waiting_tone(self, timeout=20000):
         """Attempt to detect the call waiting tone on the line within the specified timeout period. Blocking function
@@ -335,10 +497,7 @@ class CasCall(MapsCall):
         :type timeout: int
         :returns: boolean
             """
-        user_event = "Detect Call Waiting Tone"
-        gc1 = "TIMEOUT", "(i)" + str(timeout)
-        gclist = [gc1]
-        return self.cas_event(user_event, gclist, timeout)
+        return self._detect("Detect Call Waiting Tone", (timeout,), timeout)
 
     def detect_call_waiting_tone_start(self, timeout=20000):
         """Start the call waiting tone detector for detection within the timeout period. Non-blocking function
@@ -347,10 +506,7 @@ class CasCall(MapsCall):
         :type timeout: int
         :returns: boolean
         """
-        user_event = "Detect Call Waiting Tone"
-        gc1 = "TIMEOUT", "(i)" + str(timeout)
-        gclist = [gc1]
-        return self.cas_user_event_start(user_event, gclist)
+        return self._detect("Detect Call Waiting Tone", (timeout,), timeout, blocking=False)
 
     def detect_call_waiting_tone_wait_for_result(self, timeout=20000):
         """Wait for call waiting tone detector to return the results. Blocking function
@@ -359,8 +515,7 @@ class CasCall(MapsCall):
         :type timeout: int
         :returns: boolean
         """
-        user_event = "Detect Call Waiting Tone"
-        return self.cas_wait_for_event(user_event, timeout)
+        return self.cas_wait_for_event("Detect Call Waiting Tone", timeout)
 
     def detect_confirmation_tone(self, timeout=20000):
         """Attempt to detect the confirmation tone on the line within the specified timeout period. Blocking function
@@ -369,10 +524,7 @@ class CasCall(MapsCall):
         :type timeout: int
         :returns: boolean
         """
-        user_event = "Detect Confirmation Tone"
-        gc1 = "TIMEOUT", "(i)" + str(timeout)
-        gc_list = [gc1]
-        return self.cas_event(user_event, gc_list, timeout)
+        return self._detect("Detect Confirmation Tone", (timeout,), timeout)
 
     def detect_confirmation_tone_start(self, timeout=20000):
         """Start the confirmation tone detector for detection within the timeout period. Non-blocking function
@@ -381,10 +533,7 @@ class CasCall(MapsCall):
         :type timeout: int
         :returns: boolean
         """
-        user_event = "Detect Confirmation Tone"
-        gc1 = "TIMEOUT", "(i)" + str(timeout)
-        gclist = [gc1]
-        return self.cas_user_event_start(user_event, gclist)
+        return self._detect("Detect Confirmation Tone", (timeout,), timeout, blocking=False)
 
     def detect_confirmation_tone_wait_for_result(self, timeout=20000):
         """Wait for confirmation tone detector to return the results. Blocking function
@@ -393,8 +542,7 @@ class CasCall(MapsCall):
         :type timeout: int
         :returns: boolean
             """
-        user_event = "Detect Confirmation Tone"
-        return self.cas_wait_for_event(user_event, timeout)
+        return self.cas_wait_for_event("Detect Confirmation Tone", timeout)
 
     def detect_dial_tone(self, timeout=20000, dial_tone_duration=20000):
         """Attempt to detect the dial tone on the line within the specified timeout period. Blocking function.
@@ -408,11 +556,7 @@ class CasCall(MapsCall):
         :type dial_tone_duration: int
         :returns: boolean
         """
-        user_event = "Detect Dial Tone"
-        gc1 = "TIMEOUT", "(i)" + str(timeout)
-        gc2 = "DIAL_TONE_DURATION", "(i)" + str(dial_tone_duration)
-        gclist = [gc1, gc2]
-        return self.cas_event(user_event, gclist, timeout)
+        return self._detect("Detect Dial Tone", (timeout, dial_tone_duration), timeout)
 
     def detect_dial_tone_start(self, timeout=20000, dial_tone_duration=20000):
         """Start the dial tone detector for detection within the timeout period. Non-blocking function
@@ -426,11 +570,7 @@ class CasCall(MapsCall):
         :type dial_tone_duration: int
         :returns: boolean
         """
-        user_event = "Detect Dial Tone"
-        gc1 = "TIMEOUT", "(i)" + str(timeout)
-        gc2 = "DIALTONE_DURATION", "(i)" + str(dial_tone_duration)
-        gclist = [gc1, gc2]
-        return self.cas_user_event_start(user_event, gclist)
+        return self._detect("Detect Dial Tone", (timeout, dial_tone_duration), timeout, blocking=False)
 
     def detect_dial_tone_wait_for_result(self, timeout=20000):
         """Wait for dial tone detector to return the results. Blocking function
@@ -439,8 +579,7 @@ class CasCall(MapsCall):
         :type timeout: int
         :returns: boolean
         """
-        user_event = "Detect Dial Tone"
-        return self.cas_wait_for_event(user_event, timeout)
+        return self.cas_wait_for_event("Detect Dial Tone", timeout)
 
     def detect_distinctive_ringing_signal(self, ring_count, ring_on_1, ring_off_1, ring_on_2,
                                           ring_off_2, ring_on_3, ring_off_3, ring_on_4, ring_off_4, timeout=20000):
@@ -469,19 +608,9 @@ class CasCall(MapsCall):
         :type timeout: int
         :returns: boolean
         """
-        user_event = "Detect Distinctive Ringing Signal"
-        gc1 = 'TIMEOUT', "(i)" + str(timeout)
-        gc2 = 'RING_COUNT', "(i)" + str(ring_count)
-        gc3 = 'RON1', "(f)" + str(ring_on_1)
-        gc4 = 'ROFF1', "(f)" + str(ring_off_1)
-        gc5 = 'RON2', "(f)" + str(ring_on_2)
-        gc6 = 'ROFF2', "(f)" + str(ring_off_2)
-        gc7 = 'RON3', "(f)" + str(ring_on_3)
-        gc8 = 'ROFF3', "(f)" + str(ring_off_3)
-        gc9 = 'RON4', "(f)" + str(ring_on_4)
-        gc10 = 'ROFF4', "(f)" + str(ring_off_4)
-        gclist = [gc1, gc2, gc3, gc4, gc5, gc6, gc7, gc8, gc9, gc10]
-        return self.cas_event(user_event, gclist, timeout)
+        values = (timeout, ring_count, ring_on_1, ring_off_1, ring_on_2, ring_off_2,
+                  ring_on_3, ring_off_3, ring_on_4, ring_off_4)
+        return self._detect("Detect Distinctive Ringing Signal", values, timeout)
 
     def detect_distinctive_ringing_signal_start(self, ring_count, ring_on_1, ring_off_1, ring_on_2,
                                                 ring_off_2, ring_on_3, ring_off_3, ring_on_4, ring_off_4,
@@ -511,19 +640,9 @@ class CasCall(MapsCall):
         :type timeout: int
         :returns: boolean
         """
-        user_event = "Detect Distinctive Ringing Signal"
-        gc1 = 'TIMEOUT', "(i)" + str(timeout)
-        gc2 = 'RING_COUNT', "(i)" + str(ring_count)
-        gc3 = 'RON1', "(f)" + str(ring_on_1)
-        gc4 = 'ROFF1', "(f)" + str(ring_off_1)
-        gc5 = 'RON2', "(f)" + str(ring_on_2)
-        gc6 = 'ROFF2', "(f)" + str(ring_off_2)
-        gc7 = 'RON3', "(f)" + str(ring_on_3)
-        gc8 = 'ROFF3', "(f)" + str(ring_off_3)
-        gc9 = 'RON4', "(f)" + str(ring_on_4)
-        gc10 = 'ROFF4', "(f)" + str(ring_off_4)
-        gclist = [gc1, gc2, gc3, gc4, gc5, gc6, gc7, gc8, gc9, gc10]
-        return self.cas_user_event_start(user_event, gclist)
+        values = (timeout, ring_count, ring_on_1, ring_off_1, ring_on_2, ring_off_2,
+                  ring_on_3, ring_off_3, ring_on_4, ring_off_4)
+        return self._detect("Detect Distinctive Ringing Signal", values, timeout, blocking=False)
 
     def detect_distinctive_ringing_signal_wait_for_result(self, timeout=20000):
         """Wait for distinctive ringing signal detector to return result. Blocking function
@@ -532,8 +651,7 @@ class CasCall(MapsCall):
         :type timeout: int
         :returns: boolean
         """
-        user_event = "Detect Distinctive Ringing Signal"
-        return self.cas_wait_for_event(user_event, timeout)
+        return self.cas_wait_for_event("Detect Distinctive Ringing Signal", timeout)
 
     def detect_howler_tone(self, timeout=20000):
         """Attempt to detect the howler tone on the line within the timeout period. Blocking function
@@ -542,10 +660,7 @@ class CasCall(MapsCall):
         :type timeout: int
         :returns: boolean
         """
-        user_event = "Detect Howler Tone"
-        gc1 = "TIMEOUT", "(i)" + str(timeout)
-        gclist = [gc1]
-        return self.cas_event(user_event, gclist, timeout)
+        return self._detect("Detect Howler Tone", (timeout,), timeout)
 
     def detect_howler_tone_start(self, timeout=20000):
         """Start the howler tone detector on the line for detection within the timeout period. Non-blocking function
@@ -554,10 +669,7 @@ class CasCall(MapsCall):
         :type timeout: int
         :returns: boolean
         """
-        user_event = "Detect Howler Tone"
-        gc1 = "TIMEOUT", "(i)" + str(timeout)
-        gclist = [gc1]
-        return self.cas_user_event_start(user_event, gclist)
+        return self._detect("Detect Howler Tone", (timeout,), timeout, blocking=False)
 
     def detect_howler_tone_wait_for_result(self, timeout=20000):
         """Wait for howler tone detector to return result. Blocking function
@@ -566,8 +678,7 @@ class CasCall(MapsCall):
         :type timeout: int
         :returns: boolean
         """
-        user_event = "Detect Howler Tone"
-        return self.cas_wait_for_event(user_event, timeout)
+        return self.cas_wait_for_event("Detect Howler Tone", timeout)
 
     def detect_reorder_tone(self, timeout=20000, reorder_tone_duration=10000):
         """Attempt to detect the reorder tone on the line within the timeout period. Blocking function
@@ -581,11 +692,7 @@ class CasCall(MapsCall):
         :type reorder_tone_duration: int
         :returns: boolean
         """
-        user_event = "Detect Reorder Tone"
-        gc1 = "TIMEOUT", "(i)" + str(timeout)
-        gc2 = "REORDER_TONE_DURATION", "(i)" + str(reorder_tone_duration)
-        gclist = [gc1, gc2]
-        return self.cas_event(user_event, gclist, timeout)
+        return self._detect("Detect Reorder Tone", (timeout, reorder_tone_duration), timeout)
 
     def detect_reorder_tone_start(self, timeout=20000, reorder_tone_duration=10000):
         """Start the reorder tone detector on the line for detection within the timeout period. Non-blocking function
@@ -599,11 +706,7 @@ class CasCall(MapsCall):
         :type reorder_tone_duration: int
         :returns: boolean
         """
-        user_event = "Detect Reorder Tone"
-        gc1 = "TIMEOUT", "(i)" + str(timeout)
-        gc2 = "REORDER_TONE_DURATION", "(i)" + str(reorder_tone_duration)
-        gclist = [gc1, gc2]
-        return self.cas_user_event_start(user_event, gclist)
+        return self._detect("Detect Reorder Tone", (timeout, reorder_tone_duration), timeout, blocking=False)
 
     def detect_reorder_tone_wait_for_result(self, timeout=20000):
         """Wait for the reorder tone detector to return result. Blocking function
@@ -612,8 +715,7 @@ class CasCall(MapsCall):
         :type timeout: int
         :returns: boolean
         """
-        user_event = "Detect Reorder Tone"
-        return self.cas_wait_for_event(user_event, timeout)
+        return self.cas_wait_for_event("Detect Reorder Tone", timeout)
 
     def detect_ringback_tone(self, timeout=20000):
         """Attempt to detect the ringback tone on the line within the timeout period. Blocking function
@@ -622,10 +724,7 @@ class CasCall(MapsCall):
         :type timeout: int
         :returns: boolean
         """
-        user_event = "Detect Ringback Tone"
-        gc1 = "TIMEOUT", "(i)" + str(timeout)
-        gclist = [gc1]
-        return self.cas_event(user_event, gclist, timeout)
+        return self._detect("Detect Ringback Tone", (timeout,), timeout)
 
     def detect_ringback_tone_start(self, timeout=20000):
         """Start the ringback tone detector on the line for detection within the timeout period. Non-blocking function
@@ -634,10 +733,7 @@ class CasCall(MapsCall):
         :type timeout: int
         :returns: boolean
         """
-        user_event = "Detect Ringback Tone"
-        gc1 = "TIMEOUT", "(i)" + str(timeout)
-        gclist = [gc1]
-        return self.cas_user_event_start(user_event, gclist)
+        return self._detect("Detect Ringback Tone", (timeout,), timeout, blocking=False)
 
     def detect_ringback_tone_wait_for_result(self, timeout=20000):
         """Wait for ringback tone to return result. Blocking function
@@ -646,8 +742,7 @@ class CasCall(MapsCall):
         :type timeout: int
         :returns: boolean
         """
-        user_event = "Detect Ringback Tone"
-        return self.cas_wait_for_event(user_event, timeout)
+        return self.cas_wait_for_event("Detect Ringback Tone", timeout)
 
     def detect_ringing_signal(self, ring_count=1, ring_on=2000.00, ring_off=4000.00, timeout=20000):
         """Attempt to detect the ringing signal on the line within the specified timeout period. Blocking function
@@ -662,13 +757,7 @@ class CasCall(MapsCall):
         :type timeout: int
         :returns: boolean
         """
-        user_event = "Detect Ringing Signal"
-        gc1 = 'TIMEOUT', "(i)" + str(timeout)
-        gc2 = 'RING_COUNT', "(i)" + str(ring_count)
-        gc3 = 'RING_ON', "(f)" + str(ring_on)
-        gc4 = 'RING_OFF', "(f)" + str(ring_off)
-        gclist = [gc1, gc2, gc3, gc4]
-        return self.cas_event(user_event, gclist, timeout)
+        return self._detect("Detect Ringing Signal", (timeout, ring_count, ring_on, ring_off), timeout)
 
     def detect_ringing_signal_start(self, ring_count=1, ring_on=2000.00, ring_off=4000.00, timeout=20000):
         """Start the ringing signal detector on the line for detection within the specified timeout period.
@@ -684,13 +773,7 @@ class CasCall(MapsCall):
         :type timeout: int
         :returns: boolean
         """
-        user_event = "Detect Ringing Signal"
-        gc1 = 'TIMEOUT', "(i)" + str(timeout)
-        gc2 = 'RING_COUNT', "(i)" + str(ring_count)
-        gc3 = 'RING_ON', "(f)" + str(ring_on)
-        gc4 = 'RING_OFF', "(f)" + str(ring_off)
-        gclist = [gc1, gc2, gc3, gc4]
-        return self.cas_user_event_start(user_event, gclist)
+        return self._detect("Detect Ringing Signal", (timeout, ring_count, ring_on, ring_off), timeout, blocking=False)
 
     def detect_ringing_signal_wait_for_result(self, timeout=20000):
         """Wait for ringing signal detector to return result. Blocking function
@@ -699,8 +782,7 @@ class CasCall(MapsCall):
         :type timeout: int
         :returns: boolean
         """
-        user_event = "Detect Ringing Signal"
-        return self.cas_wait_for_event(user_event, timeout)
+        return self.cas_wait_for_event("Detect Ringing Signal", timeout)
 
     def detect_ring_splash(self, ring_splash_duration, timeout=20000):
         """Attempt to detect ring splash on the line within the specified timeout period. Blocking function
@@ -711,11 +793,7 @@ class CasCall(MapsCall):
         :type timeout: int
         :returns: boolean
         """
-        user_event = "Detect Ring Splash"
-        gc1 = 'TIMEOUT', "(i)" + str(timeout)
-        gc2 = 'RING_SPLASH_DURATION', "(f)" + str(ring_splash_duration)
-        gclist = [gc1, gc2]
-        return self.cas_event(user_event, gclist, timeout)
+        return self._detect("Detect Ring Splash", (timeout, ring_splash_duration), timeout)
 
     def detect_ring_splash_start(self, ring_splash_duration, timeout=20000):
         """Start the ring splash detector on the line for detection within the specified timeout period.
@@ -727,11 +805,7 @@ class CasCall(MapsCall):
         :type timeout: int
         :returns: boolean
         """
-        user_event = "Detect Ring Splash"
-        gc1 = 'TIMEOUT', "(i)" + str(timeout)
-        gc2 = 'RING_SPLASH_DURATION', "(f)" + str(ring_splash_duration)
-        gclist = [gc1, gc2]
-        return self.cas_user_event_start(user_event, gclist)
+        return self._detect("Detect Ring Splash", (timeout, ring_splash_duration), timeout, blocking=False)
 
     def detect_ring_splash_wait_for_result(self, timeout=20000):
         """Wait for ring splash detector to return results. Blocking function
@@ -740,8 +814,7 @@ class CasCall(MapsCall):
         :type timeout: int
         :returns: boolean
         """
-        user_event = "Detect Ring Splash"
-        return self.cas_wait_for_event(user_event, timeout)
+        return self.cas_wait_for_event("Detect Ring Splash", timeout)
 
     def detect_silence(self, silence_duration, timeout=20000):
         """Attempt to detect the specified amount of silence within the timeout period. Blocking function
@@ -752,11 +825,7 @@ class CasCall(MapsCall):
         :type timeout: int
         :returns: boolean
         """
-        user_event = "Detect Silence"
-        gc1 = 'TIMEOUT', "(i)" + str(timeout)
-        gc2 = 'SILENCE_DURATION', "(i)" + str(silence_duration)
-        gclist = [gc1, gc2]
-        return self.cas_event(user_event, gclist, timeout)
+        return self._detect("Detect Silence", (timeout, silence_duration), timeout)
 
     def detect_silence_start(self, silence_duration, timeout=20000):
         """Start the silence detector on the line for detection of the specified amount of silence within the timeout
@@ -768,11 +837,7 @@ class CasCall(MapsCall):
         :type timeout: int
         :returns: boolean
         """
-        user_event = "Detect Silence"
-        gc1 = 'TIMEOUT', "(i)" + str(timeout)
-        gc2 = 'SILENCE_DURATION', "(i)" + str(silence_duration)
-        gclist = [gc1, gc2]
-        return self.cas_user_event_start(user_event, gclist)
+        return self._detect("Detect Silence", (timeout, silence_duration), timeout, blocking=False)
 
     def detect_silence_wait_for_result(self, timeout=20000):
         """Wait for silence detector to return result. Blocking function
@@ -781,8 +846,7 @@ class CasCall(MapsCall):
         :type timeout: int
         :returns: boolean
         """
-        user_event = "Detect Silence"
-        return self.cas_wait_for_event(user_event, timeout)
+        return self.cas_wait_for_event("Detect Silence", timeout)
 
     def detect_special_dial_tone(self, timeout=20000):
         """Attempt to detect the special dial tone on the line within the specified timeout period. Blocking function
@@ -791,10 +855,7 @@ class CasCall(MapsCall):
         :type timeout: int
         :returns: boolean
         """
-        user_event = "Detect Special Dial Tone"
-        gc1 = "TIMEOUT", "(i)" + str(timeout)
-        gclist = [gc1]
-        return self.cas_event(user_event, gclist, timeout)
+        return self._detect("Detect Special Dial Tone", (timeout,), timeout)
 
     def detect_special_dial_tone_start(self, timeout=20000):
         """Start the special dial tone detector for detection within the timeout period. Non-blocking function
@@ -803,10 +864,7 @@ class CasCall(MapsCall):
         :type timeout: int
         :returns: boolean
         """
-        user_event = "Detect Special Dial Tone"
-        gc1 = "TIMEOUT", "(i)" + str(timeout)
-        gclist = [gc1]
-        return self.cas_user_event_start(user_event, gclist)
+        return self._detect("Detect Special Dial Tone", (timeout,), timeout, blocking=False)
 
     def detect_special_dial_tone_wait_for_result(self, timeout=20000):
         """Wait for special dial tone detector to return the results. Blocking function
@@ -815,8 +873,7 @@ class CasCall(MapsCall):
         :type timeout: int
         :returns: boolean
         """
-        user_event = "Detect Special Dial Tone"
-        return self.cas_wait_for_event(user_event, timeout)
+        return self.cas_wait_for_event("Detect Special Dial Tone", timeout)
 
     def detect_speech(self, speech_duration, timeout=20000):
         """Attempt to detect the specified amount of speech within the timeout period. Blocking function
@@ -827,11 +884,7 @@ class CasCall(MapsCall):
         :type timeout: int
         :returns: boolean
         """
-        user_event = "Verify Speech"
-        gc1 = 'TIMEOUT', "(i)" + str(timeout)
-        gc2 = 'SPEECH_DURATION', "(i)" + str(speech_duration)
-        gclist = [gc1, gc2]
-        return self.cas_event(user_event, gclist, timeout)
+        return self._detect("Verify Speech", (timeout, speech_duration), timeout)
 
     def detect_speech_start(self, speech_duration, timeout=20000):
         """Start the speech detector on the line to detect the specified amount of speech within the timeout period.
@@ -843,11 +896,7 @@ class CasCall(MapsCall):
         :type timeout: int
         :returns: boolean
         """
-        user_event = "Verify Speech"
-        gc1 = 'TIMEOUT', "(i)" + str(timeout)
-        gc2 = 'SPEECH_DURATION', "(i)" + str(speech_duration)
-        gclist = [gc1, gc2]
-        return self.cas_user_event_start(user_event, gclist)
+        return self._detect("Verify Speech", (timeout, speech_duration), timeout, blocking=False)
 
     def detect_speech_wait_for_result(self, timeout=20000):
         """Wait for speech detector to return result. Blocking function
@@ -856,8 +905,7 @@ class CasCall(MapsCall):
         :type timeout: int
         :returns: boolean
         """
-        user_event = "Verify Speech"
-        return self.cas_wait_for_event(user_event, timeout)
+        return self.cas_wait_for_event("Verify Speech", timeout)
 
     def detect_test_tone(self, timeout=20000):
         """Attempt to detect the 1004 Hz test tone on the line within the specified timeout period. Blocking function
@@ -866,10 +914,7 @@ class CasCall(MapsCall):
         :type timeout: int
         :returns: boolean
         """
-        user_event = "Detect Test Tone"
-        gc1 = "TIMEOUT", "(i)" + str(timeout)
-        gclist = [gc1]
-        return self.cas_event(user_event, gclist, timeout)
+        return self._detect("Detect Test Tone", (timeout,), timeout)
 
     def detect_test_tone_start(self, timeout=20000):
         """Start the testone detector to detect the 1004 Hz test tone on the line within the specified timeout period.
@@ -879,10 +924,7 @@ class CasCall(MapsCall):
         :type timeout: int
         :returns: boolean
         """
-        user_event = "Detect Test Tone"
-        gc1 = "TIMEOUT", "(i)" + str(timeout)
-        gclist = [gc1]
-        return self.cas_user_event_start(user_event, gclist)
+        return self._detect("Detect Test Tone", (timeout,), timeout, blocking=False)
 
     def detect_test_tone_wait_for_result(self, timeout=20000):
         """Wait for test tone detector to return result. Blocking function
@@ -891,8 +933,7 @@ class CasCall(MapsCall):
         :type timeout: int
         :returns: boolean
         """
-        user_event = "Detect Test Tone"
-        return self.cas_wait_for_event(user_event, timeout)
+        return self.cas_wait_for_event("Detect Test Tone", timeout)
 
     def detect_tone(self, freq1, freq2, timeout=20000):
         """Attempt to detect the user-defined tone on the line within the specified timeout period. Blocking function
@@ -905,12 +946,7 @@ class CasCall(MapsCall):
         :type timeout: int
         :returns: boolean
         """
-        user_event = "Detect Tone"
-        gc1 = 'TIMEOUT', "(i)" + str(timeout)
-        gc2 = 'FREQ1', "(i)" + str(freq1)
-        gc3 = 'FREQ2', "(i)" + str(freq2)
-        gclist = [gc1, gc2, gc3]
-        return self.cas_event(user_event, gclist, timeout)
+        return self._detect("Detect Tone", (timeout, freq1, freq2), timeout)
 
     def detect_tone_start(self, freq1, freq2, timeout=20000):
         """Start the tone detector to detect the user-defined tone on the line within the specified timeout period.
@@ -924,12 +960,7 @@ class CasCall(MapsCall):
         :type timeout: int
         :returns: boolean
         """
-        user_event = "Detect Tone"
-        gc1 = 'TIMEOUT', "(i)" + str(timeout)
-        gc2 = 'FREQ1', "(i)" + str(freq1)
-        gc3 = 'FREQ2', "(i)" + str(freq2)
-        gclist = [gc1, gc2, gc3]
-        return self.cas_user_event_start(user_event, gclist)
+        return self._detect("Detect Tone", (timeout, freq1, freq2), timeout, blocking=False)
 
     def detect_tone_wait_for_result(self, timeout=20000):
         """Wait for tone detector to return result. Blocking function
@@ -938,8 +969,7 @@ class CasCall(MapsCall):
         :type timeout: int
         :returns: boolean
         """
-        user_event = "Detect Tone"
-        return self.cas_wait_for_event(user_event, timeout)
+        return self.cas_wait_for_event("Detect Tone", timeout)
 
     def detect_vmwi(self, timeout=20000):
         """Attempt to detect the visual message waiting indicator on the line within the specified timeout period.
@@ -949,16 +979,10 @@ class CasCall(MapsCall):
         :type timeout: int
         :returns: boolean
         """
-        user_event = "Detect VMWI"
-        gc1 = "TIMEOUT", "(i)" + str(timeout)
-        gclist = [gc1]
-        if self.cas_event(user_event, gclist, timeout):
-            result = maps.WaitForEvent(self.handle, "VMWIStatus", timeout)
-            if result == "0":
-                self.vmwi_status = "On"
-            elif result == "1":
-                self.vmwi_status = "Off"
-            return True
+        if self._detect("Detect VMWI", (timeout,), timeout):
+            result, = self._wait_for_variables(_VMWI_VARIABLES, timeout)
+            self.vmwi_status = _VMWI_STATUS.get(result, "Not Available")
+            return self.vmwi_status != "Not Available"
         self.vmwi_status = "Not Available"
         return False
 
@@ -969,10 +993,7 @@ class CasCall(MapsCall):
         :type timeout: int
         :return:
         """
-        user_event = "Detect VMWI"
-        gc1 = "TIMEOUT", "(i)" + str(timeout)
-        gclist = [gc1]
-        return self.cas_user_event_start(user_event, gclist)
+        return self._detect("Detect VMWI", (timeout,), timeout, blocking=False)
 
     def detect_vmwi_wait_for_result(self, timeout=20000):
         """Wait for VMWI detector to return the results. Blocking function
@@ -982,13 +1003,10 @@ class CasCall(MapsCall):
         :return:
         """
         user_event = "Detect VMWI"
-        if self.cas_wait_for_event(user_event, timeout=20000):
-            result = maps.WaitForEvent(self.handle, "VMWIStatus", timeout)
-            if result == 0:
-                self.vmwi_status = "On"
-            else:
-                self.vmwi_status = "Off"
-            return True
+        if self.cas_wait_for_event(user_event, timeout):
+            result, = self._wait_for_variables(_VMWI_VARIABLES, timeout)
+            self.vmwi_status = _VMWI_STATUS.get(result, "Not Available")
+            return self.vmwi_status != "Not Available"
         self.vmwi_status = "Not Available"
         return False
 
@@ -1010,43 +1028,13 @@ class CasCall(MapsCall):
         :returns: boolean
         """
         user_event = "Flash"
-        gclist = list()
-        return self.cas_event(user_event, gclist, timeout_default)
+        return self.cas_event(user_event, _EMPTY_GCLIST, timeout_default)
 
     def get_error_message(self):
         """
         :return: String explanation of error code
         """
-        if self.return_code == "0":
-            return "None"
-        elif self.return_code == "1":
-            return "Timeout"
-        elif self.return_code == "2":
-            return "Line is onhook"
-        elif self.return_code == "3":
-            return "Line is offhook"
-        elif self.return_code == "10":
-            return "Digit: Invalid type"
-        elif self.return_code == "20":
-            return "Region is undefined"
-        elif self.return_code == "30":
-            return "Fax: Out of rates"
-        elif self.return_code == "31":
-            return "Fax: Invalid data rate"
-        elif self.return_code == "32":
-            return "Fax: Frame check error"
-        elif self.return_code == "33":
-            return "Fax: Failure"
-        elif self.return_code == "34":
-            return "Fax: Another session active"
-        elif self.return_code == "35":
-            return "Fax: T1 timeout"
-        elif self.return_code == "36":
-            return "Fax: Cannot open TIFF file"
-        elif self.return_code == "37":
-            return "Fax: TIFF file name missing"
-        else:
-            return "Error %s" % self.return_code
+        return _ERROR_MESSAGES.get(self.return_code, "Error %s" % self.return_code)
 
     def get_vmwi(self):
         """Return VMWI status
@@ -1067,7 +1055,7 @@ class CasCall(MapsCall):
         :return: boolean
         """
         user_event = "Set Tone Detection"
-        gc1 = 'TONE_TYPE', "(i)" + str(tone_type)
+        gc1 = 'TONE_TYPE', "(i)%s" % tone_type
         gclist = [gc1]
         return self.cas_event(user_event, gclist, timeout_default)
 
@@ -1085,10 +1073,10 @@ class CasCall(MapsCall):
         :returns: boolean
         """
         user_event = "Set Fax"
-        gc1 = 'FAX_MIN_DATA_RATE', "(i)" + str(min_data_rate)
-        gc2 = 'FAX_MAX_DATA_RATE', "(i)" + str(max_data_rate)
+        gc1 = 'FAX_MIN_DATA_RATE', "(i)%s" % min_data_rate
+        gc2 = 'FAX_MAX_DATA_RATE', "(i)%s" % max_data_rate
         gc3 = 'FAX_CODEC_TYPE', "(s)" + codec
-        gc4 = 'FAX_ECMENABLED', "(i)" + str(ecm_enable)
+        gc4 = 'FAX_ECMENABLED', "(i)%s" % ecm_enable
         gclist = [gc1, gc2, gc3, gc4]
         return self.cas_event(user_event, gclist, timeout_default)
 
@@ -1117,7 +1105,7 @@ class CasCall(MapsCall):
         :returns: boolean
         """
         event_name = "Detect Digits"
-        gc1 = 'TIMEOUT', "(i)" + str(timeout)
+        gc1 = 'TIMEOUT', "(i)%s" % timeout
         gc2 = 'DIGIT_TYPE', "(s)" + 'dtmf'
         gclist = [gc1, gc2]
         return self.cas_user_event_start(event_name, gclist)
@@ -1131,7 +1119,7 @@ class CasCall(MapsCall):
         """
         event_name = "Detect Digits"
         if self.cas_wait_for_event(event_name, timeout):
-            self.rx_digits = maps.WaitForEvent(self.handle, "DetectedDigits", 2000)
+            self.rx_digits, = self._wait_for_variables(_DIGIT_VARIABLES, timeout)
             return True
         return False
 
@@ -1156,8 +1144,7 @@ class CasCall(MapsCall):
         :type timeout: int
         :returns: boolean
         """
-        user_event = "FaxReceived"
-        return self.cas_wait_for_event(user_event, timeout)
+        return self.cas_wait_for_event("FaxReceived", timeout)
 
     def tdm_receive_file_start(self, rx_filename, rx_file_duration):
         """Start file reception. Non-blocking function
@@ -1169,7 +1156,7 @@ class CasCall(MapsCall):
         :returns: boolean
         """
         event_name = "Receive File"
-        gc1 = 'FILE_DURATION', "(i)" + str(rx_file_duration)
+        gc1 = 'FILE_DURATION', "(i)%s" % rx_file_duration
         gc2 = 'RX_PATH', "(s)" + rx_filename
         gclist = [gc1, gc2]
         return self.cas_event(event_name, gclist, rx_file_duration)
@@ -1180,8 +1167,7 @@ class CasCall(MapsCall):
         :returns: boolean
         """
         user_event = "Stop Receive File"
-        gclist = list()
-        return self.cas_event(user_event, gclist, timeout_default)
+        return self.cas_event(user_event, _EMPTY_GCLIST, timeout_default)
 
     def tdm_receive_file_voice_activated_start(self, rx_filename, wait_for_voice_timeout,
                                                end_of_voice_silence_duration, minimum_receive_duration):
@@ -1201,9 +1187,9 @@ class CasCall(MapsCall):
         :returns: boolean
         """
         event_name = "Receive File Voice Activated"
-        gc1 = 'TIMEOUT', "(i)" + str(wait_for_voice_timeout)
-        gc2 = 'SILENCE_DURATION', "(i)" + str(end_of_voice_silence_duration)
-        gc3 = 'MINIMUM_RECEIVE_DURATION', "(i)" + str(minimum_receive_duration)
+        gc1 = 'TIMEOUT', "(i)%s" % wait_for_voice_timeout
+        gc2 = 'SILENCE_DURATION', "(i)%s" % end_of_voice_silence_duration
+        gc3 = 'MINIMUM_RECEIVE_DURATION', "(i)%s" % minimum_receive_duration
         gc4 = 'RX_PATH', "(s)" + rx_filename
         gclist = [gc1, gc2, gc3, gc4]
         return self.cas_user_event_start(event_name, gclist)
@@ -1215,8 +1201,7 @@ class CasCall(MapsCall):
         :type timeout: int
         :returns: boolean
         """
-        user_event = "ReceiveFileVoiceActivated"
-        return self.cas_wait_for_event(user_event, timeout)
+        return self.cas_wait_for_event("ReceiveFileVoiceActivated", timeout)
 
     def tdm_receive_file_wait_for_completion(self, timeout=20000):
         """Wait for file reception to complete
@@ -1231,6 +1216,9 @@ class CasCall(MapsCall):
     def tdm_send_digits(self, digit_type='dtmf', digits='12345', power='-10.00', on_time=80, off_time=80):
         """Send digits
 
+        All digits are sent with one user event, so pass the whole string rather than
+        calling this once per digit.
+
         :param digit_type: "dtmf" or "mf"
         :type digit_type: string
         :param digits: digits to send
@@ -1244,8 +1232,8 @@ class CasCall(MapsCall):
         :returns: boolean
         """
         user_event = "Send Digits"
-        gc1 = 'DIGIT_ON', "(i)" + str(on_time)
-        gc2 = 'DIGIT_OFF', "(i)" + str(off_time)
+        gc1 = 'DIGIT_ON', "(i)%s" % on_time
+        gc2 = 'DIGIT_OFF', "(i)%s" % off_time
         gc3 = 'DIGITS', "(s)" + digits
         gc4 = 'DIGIT_POWER', "(s)" + power
         gc5 = 'DIGIT_TYPE', "(s)" + digit_type
@@ -1273,8 +1261,7 @@ class CasCall(MapsCall):
         :type timeout: int
         :returns: boolean
         """
-        user_event = "FaxSent"
-        return self.cas_wait_for_event(user_event, timeout)
+        return self.cas_wait_for_event("FaxSent", timeout)
 
     def tdm_send_file_start(self, filename, duration):
         """Start file transmission. Non-blocking function
@@ -1286,7 +1273,7 @@ class CasCall(MapsCall):
         :returns: boolean
         """
         event_name = "Send File"
-        gc1 = 'FILE_DURATION', "(i)" + str(duration)
+        gc1 = 'FILE_DURATION', "(i)%s" % duration
         gc2 = 'TX_PATH', "(s)" + filename
         gclist = [gc1, gc2]
         return self.cas_event(event_name, gclist, duration)
@@ -1297,8 +1284,7 @@ class CasCall(MapsCall):
         :returns: boolean
         """
         user_event = "Stop Send File"
-        gclist = list()
-        return self.cas_event(user_event, gclist, timeout_default)
+        return self.cas_event(user_event, _EMPTY_GCLIST, timeout_default)
 
     def tdm_send_file_wait_for_completion(self, timeout=20000):
         """Wait for file transmission to complete. Blocking function
@@ -1318,7 +1304,7 @@ class CasCall(MapsCall):
         :returns: boolean
         """
         user_event = "Send Test Tone"
-        gc1 = 'TONE_DURATION', "(i)" + str(duration)
+        gc1 = 'TONE_DURATION', "(i)%s" % duration
         gclist = [gc1]
         return self.cas_event(user_event, gclist, timeout_default)
 
@@ -1334,9 +1320,9 @@ class CasCall(MapsCall):
         :returns: boolean
         """
         user_event = "Send Tone"
-        gc1 = 'TONE_DURATION', "(i)" + str(duration)
-        gc2 = 'FREQ1', "(i)" + str(freq1)
-        gc3 = 'FREQ2', "(i)" + str(freq2)
+        gc1 = 'TONE_DURATION', "(i)%s" % duration
+        gc2 = 'FREQ1', "(i)%s" % freq1
+        gc3 = 'FREQ2', "(i)%s" % freq2
         gclist = [gc1, gc2, gc3]
         return self.cas_event(user_event, gclist, duration + timeout_default)
 
@@ -1347,15 +1333,8 @@ class CasCall(MapsCall):
         :type timeout: int
         :returns: CallerId
         """
-        user_event = "Detect Caller ID"
-        gc1 = 'TIMEOUT', "(i)" + str(timeout)
-        gclist = [gc1]
-        if self.cas_event(user_event, gclist, timeout):
-            tmp_name = maps.WaitForEvent(self.handle, "CIDName", timeout)
-            tmp_number = maps.WaitForEvent(self.handle, "CIDNumber", timeout)
-            tmp_date = maps.WaitForEvent(self.handle, "CIDDate", timeout)
-            tmp_time = maps.WaitForEvent(self.handle, "CIDTime", timeout)
-            return CallerId(tmp_name, tmp_number, tmp_date, tmp_time)
+        if self._detect("Detect Caller ID", (timeout,), timeout):
+            return CallerId(*self._wait_for_variables(_CALLER_ID_VARIABLES, timeout))
         else:
             return CallerId()
 
@@ -1367,10 +1346,7 @@ class CasCall(MapsCall):
         :type timeout: int
         :returns: CallerId
         """
-        user_event = "Detect Caller ID"
-        gc1 = 'TIMEOUT', "(i)" + str(timeout)
-        gclist = [gc1]
-        return self.cas_user_event_start(user_event, gclist)
+        return self._detect("Detect Caller ID", (timeout,), timeout, blocking=False)
 
     def detect_caller_id_wait_for_result(self, timeout=20000):
         """Wait for caller id detector to return result. Blocking function
@@ -1381,28 +1357,48 @@ class CasCall(MapsCall):
         """
         user_event = "Detect Caller ID"
         if self.cas_wait_for_event(user_event, timeout):
-            tmp_name = maps.WaitForEvent(self.handle, "CIDName", timeout)
-            tmp_number = maps.WaitForEvent(self.handle, "CIDNumber", timeout)
-            tmp_date = maps.WaitForEvent(self.handle, "CIDDate", timeout)
-            tmp_time = maps.WaitForEvent(self.handle, "CIDTime", timeout)
-            return CallerId(tmp_name, tmp_number, tmp_date, tmp_time)
+            return CallerId(*self._wait_for_variables(_CALLER_ID_VARIABLES, timeout))
         else:
             return CallerId()
 
 
 class CallerId(object):
-    def __init__(self, *arg):
-        if len(arg) == 0:
-            self.name = ""
-            self.number = ""
-            self.date = ""
-            self.time = ""
-        else:
-            self.name = arg[0]
-            self.number = arg[1]
-            self.date = arg[2]
-            self.time = arg[3]
-            super(CallerId, self).__init__()
+    __slots__ = ("name", "number", "date", "time")
+
+    def __init__(self, name="", number="", date="", time=""):
+        self.name = name
+        self.number = number
+        self.date = date
+        self.time = time
 
 
 timeout_default = 20000
+
+# Variables the CLI server sets after a Detect Caller ID user event, in CallerId order
+_CALLER_ID_VARIABLES = ("CIDName", "CIDNumber", "CIDDate", "CIDTime")
+
+# Variables the CLI server sets after a Detect VMWI user event
+_VMWI_VARIABLES = ("VMWIStatus",)
+# VMWIStatus values, see CasCall.get_vmwi()
+_VMWI_STATUS = {"0": "On", "1": "Off"}
+
+# Variables the CLI server sets after a Detect Digits user event
+_DIGIT_VARIABLES = ("DetectedDigits",)
+
+# Explanations of CasCall.return_code values, see CasCall.get_error_message()
+_ERROR_MESSAGES = {
+    "0": "None",
+    "1": "Timeout",
+    "2": "Line is onhook",
+    "3": "Line is offhook",
+    "10": "Digit: Invalid type",
+    "20": "Region is undefined",
+    "30": "Fax: Out of rates",
+    "31": "Fax: Invalid data rate",
+    "32": "Fax: Frame check error",
+    "33": "Fax: Failure",
+    "34": "Fax: Another session active",
+    "35": "Fax: T1 timeout",
+    "36": "Fax: Cannot open TIFF file",
+    "37": "Fax: TIFF file name missing",
+}
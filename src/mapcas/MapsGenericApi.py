@@ -3,6 +3,8 @@ import time
 
 
 class MapsClient(object):
+    __slots__ = ("server_ip", "server_port", "protocol", "status", "testbed", "connection_id", "response_code")
+
     def __init__(self, server_ip, server_port, testbed):
         """Client object to communicate with MAPS server
 
@@ -21,8 +23,7 @@ class MapsClient(object):
         self.protocol = 'NONE'
         self.status = ''
         self.testbed = testbed
-        script_list = []
-        connection_id = 0
+        self.connection_id = 0
         self.response_code = UNKNOWN_RESPONSE_CODE
 
 
@@ -52,6 +53,7 @@ class MapsClient(object):
         """
         result = DISCONNECT_FAILED
         if maps.Disconnect(self.connection_id) != 0:
+            self.connection_id = 0
             self.status = "DISCONNECTED"
             result = SUCCESS
         return result
@@ -63,18 +65,11 @@ class MapsClient(object):
 
         :returns: 0 if success, >0 if failure
         """
-        
-        GCList = list()
-        if maps.StartTestBedSetUp(self.connection_id, self.testbed, GCList) != 0:
+        if maps.StartTestBedSetUp(self.connection_id, self.testbed, _EMPTY_GCLIST) != 0:
             start_status = maps.WaitForEvent(self.connection_id, "StartStatus", 10000, 0)
-            if start_status == "Started":
-                result = SUCCESS
+            result = _START_STATUS.get(start_status, SERVER_ERROR_PARSING_ERROR_IN_THE_MAPS_INIT_SCRIPT)
+            if result == SUCCESS:
                 self.status = "STARTED"
-            elif start_status == "Maps init script not found":
-                result = SERVER_ERROR_MAPS_INIT_SCRIPT_NOT_FOUND
-            else:
-                result = SERVER_ERROR_PARSING_ERROR_IN_THE_MAPS_INIT_SCRIPT
-                # print "Parsing error line number = " + str(get_line_number(start_status))
         else:
             result = SENDING_FAILED        
         return result
@@ -85,13 +80,9 @@ class MapsClient(object):
         :param profile_group: name of .xml file to load (with .xml extension)
         :returns: 0 for success, >0 for failure
         """
-        result = SUCCESS
         if maps.LoadProfile(self.connection_id, profile_group) != 0:
             status = maps.WaitForEvent(self.connection_id, "LoadProfileStatus", DEFAULT_TIME_OUT, 0)
-            if status == "":
-                result = SERVER_ERROR_TEST_BED_NOT_STARTED
-            elif status != "Profile Loaded":
-                result = PROFILE_LOADING_FAILURE
+            result = _LOAD_PROFILE_STATUS.get(status, PROFILE_LOADING_FAILURE)
         else:
             result = SENDING_FAILED   
         return result
@@ -106,9 +97,22 @@ class MapsClient(object):
         :param variable_value: the value this variable should store
         :returns: 0 for success, >0 for failure
         """
+        return self.set_global_variables({variable_name: (variable_type, variable_value)})
+
+    def set_global_variables(self, variables):
+        """Set several global variables for server testbed in one request.
+
+        An empty dict sends nothing and returns SUCCESS.
+
+        :param variables: dict mapping variable name to (variable_type, variable_value),
+            see set_global_variable()
+        :returns: 0 for success, >0 for failure
+        """
         result = SUCCESS
-        function_arg = variable_name, variable_type + variable_value
-        arg = [function_arg]
+        if not variables:
+            return result
+        arg = [(name, variable_type + variable_value)
+               for name, (variable_type, variable_value) in variables.items()]
         if maps.ApplyGlobalEvent(self.connection_id, arg) == 0:
             result = SENDING_FAILED
         return result
@@ -132,12 +136,7 @@ class MapsClient(object):
         """
         if maps.StopTestBedSetUp(self.connection_id) != 0:
             status = maps.WaitForEvent(self.connection_id, "StopStatus", DEFAULT_TIME_OUT, 0)
-            if status == "Stopped":
-                result = SUCCESS
-            elif status == "MapsShutdown script is not exist":
-                result = SERVER_ERROR_MAPS_SHUT_DOWN_SCRIPT_NOT_FOUND
-            else:
-                result = SERVER_ERROR_PARSING_ERROR_IN_THE_MAPS_SHUT_DOWN_SCRIPT
+            result = _STOP_STATUS.get(status, SERVER_ERROR_PARSING_ERROR_IN_THE_MAPS_SHUT_DOWN_SCRIPT)
         else:
             result = SENDING_FAILED
         return result
@@ -155,6 +154,8 @@ class MapsCall(object):
     :param level: [ 'HIGH' | 'LOW' ]
     :param call_type: determines what script to start at server.
     """
+    __slots__ = ("handle", "status", "level", "type", "message_list", "response_code")
+
     def __init__(self, handle, status, level, call_type):
         self.handle = handle
         self.status = status
@@ -172,18 +173,25 @@ class MapsCall(object):
         :param variable_value: Value to be stored by variable in script.
         :returns: 0 if success, 0> if failure
         """
-        if type(variable_value) == type(int()):
-            variable_type = "(i)"
-            function_arg = variable_name, variable_type + `variable_value`
-        elif type(variable_value) == type(str()):
-            variable_type = "(s)"
-            function_arg = variable_name, variable_type + variable_value
-        elif type(variable_value) == type(float()):
-            variable_type = "(f)"
-            function_arg = variable_name, variable_type + variable_value
-            
+        return self.set_local_variables({variable_name: variable_value})
+
+    def set_local_variables(self, variables):
+        """Set several local variables in server side script with one user event.
+
+        An empty dict sends nothing and returns SUCCESS.
+
+        :param variables: dict mapping variable name to int, str or float value
+        :returns: 0 if success, 0> if failure
+        """
+        if not variables:
+            return SUCCESS
+        arg = []
+        for variable_name, variable_value in variables.items():
+            typed_value = _typed_value(variable_value)
+            if typed_value is None:
+                return UNKNOWN_DATATYPE
+            arg.append((variable_name, typed_value))
         result = SUCCESS
-        arg = [function_arg]
         if maps.UserEvent(self.handle, "SetVariable", arg) != 0:
             status = maps.WaitForEvent(self.handle, "UserEventStatus", DEFAULT_TIME_OUT)
             if status == "":
@@ -221,21 +229,25 @@ class MapsCall(object):
         return response
         
     def wait_for_call_connect(self, time_out):
-        # todo.doc
-        """
+        """Wait for the server-side script to report the call as connected.
 
-        :param time_out:
-        :returns:
+        Every CallStatus update the script sends is read until one reports
+        "Connected". Intermediate states such as "Ringing" do not end the wait;
+        all reads share one deadline of time_out msec.
+
+        :param time_out: timeout in msec
+        :returns: last call status reported by the server, "" on timeout
         """
-        time_out /= 1000
+        deadline = time.time() + time_out / 1000.0
         response = ""
+        while response != "Connected":
+            remaining = int((deadline - time.time()) * 1000)
+            if remaining <= 0:
+                break
+            response = maps.WaitForEvent(self.handle, "CallStatus", remaining)
+            if response == "":
+                break
         result = SUCCESS
-        while time_out > 0:
-            response = get_call_status(handle)
-            if response == "Connected":
-                time_out = 0
-            else:
-                time_out -= 1
         if response != "Connected":
             result = WAIT_FOR_CALL_CONNECT_FAILURE
         self.status = response
@@ -246,7 +258,24 @@ class MapsCall(object):
         """Must be overridden by subclass"""
         raise NotImplementedError
 
-        
+
+def _typed_value(value):
+    """Prefix a script variable value with its MAPS type tag.
+
+    :param value: int, str or float value; bools are sent as 0 or 1
+    :returns: tagged value string, None for any other type
+    """
+    if isinstance(value, bool):
+        return "(i)%d" % value
+    if isinstance(value, int):
+        return "(i)" + str(value)
+    if isinstance(value, str):
+        return "(s)" + value
+    if isinstance(value, float):
+        return "(f)" + repr(value)
+    return None
+
+
 DEFAULT_TIME_OUT = 3000
         
 SUCCESS = 0
@@ -278,6 +307,7 @@ UNKNOWN_RESPONSE_CODE = 124
 UNKNOWN_VARIABLE = 125
 SUSPEND_CALL_FAILURE = 126
 RESUME_CALL_FAILURE = 127
+WAIT_FOR_CALL_CONNECT_FAILURE = 128
 
 SERVER_ERROR_TEST_BED_NOT_STARTED = 300
 SERVER_ERROR_MAPS_INIT_SCRIPT_NOT_FOUND = 301
@@ -294,3 +324,23 @@ SERVER_ERROR_PARAMETER_LIST_EMPTY = 310
 INT = "INT"
 STRING = "STRING"
 FLOAT = "FLOAT"
+
+# Testbed lifecycle statuses reported by the server, mapped to result codes.
+# Statuses not listed map to the parsing error (start, stop) or
+# PROFILE_LOADING_FAILURE (load).
+_START_STATUS = {
+    "Started": SUCCESS,
+    "Maps init script not found": SERVER_ERROR_MAPS_INIT_SCRIPT_NOT_FOUND,
+}
+_LOAD_PROFILE_STATUS = {
+    "Profile Loaded": SUCCESS,
+    "": SERVER_ERROR_TEST_BED_NOT_STARTED,
+}
+_STOP_STATUS = {
+    "Stopped": SUCCESS,
+    "MapsShutdown script is not exist": SERVER_ERROR_MAPS_SHUT_DOWN_SCRIPT_NOT_FOUND,
+}
+
+# Shared variable list for requests that take no variables. PythonMapsCliIfc
+# only reads it, but requires a list rather than a tuple; never append to it.
+_EMPTY_GCLIST = []